@@ -1,182 +1,57 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import List
-from uuid import UUID
+import json
 from datetime import datetime
+from pathlib import Path
+from uuid import UUID
 
-app = FastAPI()
-
-# AUTO-GENERATED endpoints (regenerated from backend/_registry.json)
-
-class AIAnalysisServiceModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-aianalysisservice_store: List[AIAnalysisServiceModel] = []
-
-@app.get("/aianalysisservices", response_model=List[AIAnalysisServiceModel])
-async def get_aianalysisservices():
-    return aianalysisservice_store
-
-@app.post("/aianalysisservice", response_model=AIAnalysisServiceModel)
-async def post_aianalysisservice(payload: AIAnalysisServiceModel):
-    aianalysisservice_store.append(payload)
-    return payload
-
-class ConflictResolutionViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-conflictresolutionviewmodel_store: List[ConflictResolutionViewModelModel] = []
-
-@app.get("/conflictresolutionviewmodels", response_model=List[ConflictResolutionViewModelModel])
-async def get_conflictresolutionviewmodels():
-    return conflictresolutionviewmodel_store
-
-@app.post("/conflictresolutionviewmodel", response_model=ConflictResolutionViewModelModel)
-async def post_conflictresolutionviewmodel(payload: ConflictResolutionViewModelModel):
-    conflictresolutionviewmodel_store.append(payload)
-    return payload
-
-class DashboardViewModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-dashboardview_store: List[DashboardViewModel] = []
-
-@app.get("/dashboardviews", response_model=List[DashboardViewModel])
-async def get_dashboardviews():
-    return dashboardview_store
-
-@app.post("/dashboardview", response_model=DashboardViewModel)
-async def post_dashboardview(payload: DashboardViewModel):
-    dashboardview_store.append(payload)
-    return payload
-
-class EmailpasswordLoginViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-emailpasswordloginviewmodel_store: List[EmailpasswordLoginViewModelModel] = []
-
-@app.get("/emailpasswordloginviewmodels", response_model=List[EmailpasswordLoginViewModelModel])
-async def get_emailpasswordloginviewmodels():
-    return emailpasswordloginviewmodel_store
-
-@app.post("/emailpasswordloginviewmodel", response_model=EmailpasswordLoginViewModelModel)
-async def post_emailpasswordloginviewmodel(payload: EmailpasswordLoginViewModelModel):
-    emailpasswordloginviewmodel_store.append(payload)
-    return payload
-
-class EntryCategorizationtaggingViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-entrycategorizationtaggingviewmodel_store: List[EntryCategorizationtaggingViewModelModel] = []
-
-@app.get("/entrycategorizationtaggingviewmodels", response_model=List[EntryCategorizationtaggingViewModelModel])
-async def get_entrycategorizationtaggingviewmodels():
-    return entrycategorizationtaggingviewmodel_store
-
-@app.post("/entrycategorizationtaggingviewmodel", response_model=EntryCategorizationtaggingViewModelModel)
-async def post_entrycategorizationtaggingviewmodel(payload: EntryCategorizationtaggingViewModelModel):
-    entrycategorizationtaggingviewmodel_store.append(payload)
-    return payload
-
-class ImplementBackuprestoreFunctionalityViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-implementbackuprestorefunctionalityviewmodel_store: List[ImplementBackuprestoreFunctionalityViewModelModel] = []
-
-@app.get("/implementbackuprestorefunctionalityviewmodels", response_model=List[ImplementBackuprestoreFunctionalityViewModelModel])
-async def get_implementbackuprestorefunctionalityviewmodels():
-    return implementbackuprestorefunctionalityviewmodel_store
-
-@app.post("/implementbackuprestorefunctionalityviewmodel", response_model=ImplementBackuprestoreFunctionalityViewModelModel)
-async def post_implementbackuprestorefunctionalityviewmodel(payload: ImplementBackuprestoreFunctionalityViewModelModel):
-    implementbackuprestorefunctionalityviewmodel_store.append(payload)
-    return payload
-
-class ImplementUserAuthenticationServiceViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-implementuserauthenticationserviceviewmodel_store: List[ImplementUserAuthenticationServiceViewModelModel] = []
+app = FastAPI(default_response_class=ORJSONResponse)
 
-@app.get("/implementuserauthenticationserviceviewmodels", response_model=List[ImplementUserAuthenticationServiceViewModelModel])
-async def get_implementuserauthenticationserviceviewmodels():
-    return implementuserauthenticationserviceviewmodel_store
+# AUTO-GENERATED endpoints (regenerated from backend/_registry.json)
 
-@app.post("/implementuserauthenticationserviceviewmodel", response_model=ImplementUserAuthenticationServiceViewModelModel)
-async def post_implementuserauthenticationserviceviewmodel(payload: ImplementUserAuthenticationServiceViewModelModel):
-    implementuserauthenticationserviceviewmodel_store.append(payload)
-    return payload
+class BaseEntry(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-class InitialSyncImplementationViewModelModel(BaseModel):
     id: UUID
     title: str
     createdAt: datetime
     body: str | None = None
 
-initialsyncimplementationviewmodel_store: List[InitialSyncImplementationViewModelModel] = []
 
-@app.get("/initialsyncimplementationviewmodels", response_model=List[InitialSyncImplementationViewModelModel])
-async def get_initialsyncimplementationviewmodels():
-    return initialsyncimplementationviewmodel_store
+def register_crud(app: FastAPI, name: str, Model: type[BaseEntry]) -> None:
+    """Register the list-GET and create-POST endpoints for one feature."""
+    route = name.lower()
+    store: dict[UUID, BaseEntry] = {}
+    # Serialized GET response, rebuilt lazily after each write.
+    blob: bytes | None = None
 
-@app.post("/initialsyncimplementationviewmodel", response_model=InitialSyncImplementationViewModelModel)
-async def post_initialsyncimplementationviewmodel(payload: InitialSyncImplementationViewModelModel):
-    initialsyncimplementationviewmodel_store.append(payload)
-    return payload
+    async def get_items():
+        nonlocal blob
+        if blob is None:
+            blob = orjson.dumps(
+                [m.model_dump(mode="json", exclude_unset=True) for m in store.values()]
+            )
+        return Response(content=blob, media_type="application/json")
 
-class JournalEntryViewModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
-
-journalentryview_store: List[JournalEntryViewModel] = []
-
-@app.get("/journalentryviews", response_model=List[JournalEntryViewModel])
-async def get_journalentryviews():
-    return journalentryview_store
-
-@app.post("/journalentryview", response_model=JournalEntryViewModel)
-async def post_journalentryview(payload: JournalEntryViewModel):
-    journalentryview_store.append(payload)
-    return payload
+    async def post_item(payload: Model):
+        nonlocal blob
+        store[payload.id] = payload
+        blob = None
+        return payload
 
-class MoodTrackingInterfaceViewModelModel(BaseModel):
-    id: UUID
-    title: str
-    createdAt: datetime
-    body: str | None = None
+    get_items.__name__ = f"get_{route}s"
+    post_item.__name__ = f"post_{route}"
+    app.get(f"/{route}s", response_model=None)(get_items)
+    app.post(f"/{route}", response_model=Model, response_model_exclude_unset=True)(post_item)
 
-moodtrackinginterfaceviewmodel_store: List[MoodTrackingInterfaceViewModelModel] = []
 
-@app.get("/moodtrackinginterfaceviewmodels", response_model=List[MoodTrackingInterfaceViewModelModel])
-async def get_moodtrackinginterfaceviewmodels():
-    return moodtrackinginterfaceviewmodel_store
+_REGISTRY_PATH = Path(__file__).parent / "_registry.json"
 
-@app.post("/moodtrackinginterfaceviewmodel", response_model=MoodTrackingInterfaceViewModelModel)
-async def post_moodtrackinginterfaceviewmodel(payload: MoodTrackingInterfaceViewModelModel):
-    moodtrackinginterfaceviewmodel_store.append(payload)
-    return payload
+for _name in json.loads(_REGISTRY_PATH.read_text(encoding="utf8")):
+    register_crud(app, _name, type(_name + "Model", (BaseEntry,), {}))
 
 
 from .auth import router as auth_router